@@ -8,7 +8,7 @@ import re
 from app.db import get_db
 from app.models import Insight
 from app.schemas import InsightIngest, InsightCreate, InsightResponse, InsightFilter
-from app.core import TextProcessor
+from app.core.text_processor import text_processor
 from app.core.rss_scraper import RSSFeedScraper
 from app.core.source_manager import SourceManager
 
@@ -25,11 +25,10 @@ async def ingest_insight(
     """
     try:
         # Process the raw text
-        processor = TextProcessor()
-        insight_data = processor.extract_insight(ingest_data.raw_text)
+        insight_data = text_processor.extract_insight(ingest_data.raw_text)
         
         # Generate snippet for highlighting
-        snippet = processor.extract_relevant_snippet(ingest_data.raw_text)
+        snippet = text_processor.extract_relevant_snippet(ingest_data.raw_text)
         
         # Create database record
         db_insight = Insight(
@@ -283,7 +282,6 @@ async def get_insights(
         
         # Enhance snippets for search queries or tool filtering if needed
         if q or mentioned_tools:
-            processor = TextProcessor()
             enhanced_insights = []
             
             for insight in insights:
@@ -308,7 +306,7 @@ async def get_insights(
                     if matching_tools:
                         highlight_query = matching_tools[0]  # Highlight the first matching tool
                 
-                smart_snippet = processor.extract_relevant_snippet(
+                smart_snippet = text_processor.extract_relevant_snippet(
                     combined_text, highlight_query, max_length=200, highlight=True
                 )
                 
@@ -1,14 +1,54 @@
 """
 Centralized keyword filtering for content relevance detection.
 """
-import json
+import functools
 import logging
+import os
 import re
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import Any, List, Dict, Set, Optional
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Coding agent context keywords
+_CODING_CONTEXT = (
+    "coding", "agent", "assistant", "ai", "programming", "developer", "sourcegraph",
+    "cody", "copilot", "ide", "editor", "code", "development",
+)
+
+# Short ambiguous keywords that also match in their uppercase form
+_SHORT_KEYWORDS = ("ai", "ml", "qa", "ci", "cd")
+
+_AMP_RE = re.compile(r'\b(Amp|AMP|AmpCode)\b')
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Read and parse a keywords config file, cached per path and modification time."""
+    return orjson.loads(Path(path).read_bytes())
+
+
+@functools.lru_cache(maxsize=1024)
+def _keyword_pattern(keyword: str) -> re.Pattern:
+    """
+    Compile (and cache) the word-boundary pattern for a keyword.
+    
+    Equivalent to \bkeyword\b, but written literal-first with the leading boundary
+    checked in a lookbehind so the regex engine can use its fast literal search.
+    """
+    escaped = re.escape(keyword)
+    return re.compile(rf'{escaped}(?<=\b{escaped})\b')
+
+
+@functools.lru_cache(maxsize=1024)
+def _keyword_tokens(keyword: str) -> frozenset:
+    """Word tokens a text must contain for the keyword to match on word boundaries."""
+    return frozenset(_TOKEN_RE.findall(keyword))
+
 
 class KeywordFilter:
     """
@@ -52,8 +92,8 @@ class KeywordFilter:
             config_path = Path(__file__).parent.parent / "config" / "keywords.json"
         
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            # Keyed on mtime so edits to the file are picked up without a restart
+            config = _read_config(str(config_path), os.stat(config_path).st_mtime_ns)
             
             global_keywords = config.get("global_keywords", [])
             per_source_overrides = config.get("per_source_keywords", {})
@@ -65,13 +105,14 @@ class KeywordFilter:
             # Return empty filter as fallback
             return cls()
     
-    def match_content(self, source_name: str, text: str) -> List[str]:
+    def match_content(self, source_name: str, text: str, text_lower: Optional[str] = None) -> List[str]:
         """
         Check content text (title, summary, body) for contextual keyword matches.
         
         Args:
             source_name: Name of the source
             text: Content text to check
+            text_lower: text.lower(), if the caller already has it
             
         Returns:
             List of matched keywords with contextual validation
@@ -83,29 +124,74 @@ class KeywordFilter:
         if not keywords_to_check:
             return []
         
-        text_lower = text.lower()
+        return self._match_keywords(text, keywords_to_check, text_lower)
+    
+    def match_bulk_by_source(self, sources: List[str], texts: List[str]) -> List[List[str]]:
+        """
+        Check many content texts, resolving each source's keyword set only once.
+        
+        Args:
+            sources: Source name for each text
+            texts: Content texts to check, parallel to sources
+            
+        Returns:
+            Matched keywords for each text, in input order (as match_content would return)
+        """
+        keywords_by_source = {}
+        results = []
+        
+        for source_name, text in zip(sources, texts):
+            keywords_to_check = keywords_by_source.get(source_name)
+            if keywords_to_check is None:
+                keywords_to_check = keywords_by_source[source_name] = self.get_keywords_for_source(source_name)
+            
+            if not text or not keywords_to_check:
+                results.append([])
+            else:
+                results.append(self._match_keywords(text, keywords_to_check))
+        
+        return results
+    
+    def _match_keywords(
+        self,
+        text: str,
+        keywords_to_check: Set[str],
+        text_lower: Optional[str] = None
+    ) -> List[str]:
+        """Match keywords against non-empty content text with contextual validation."""
+        # The original text is still needed: "amp" and short keywords are case-sensitive
+        if text_lower is None:
+            text_lower = text.lower()
         matched = []
         
-        # Coding agent context keywords
-        coding_context = ["coding", "agent", "assistant", "ai", "programming", "developer", "sourcegraph", "cody", "copilot", "ide", "editor", "code", "development"]
-        has_coding_context = any(ctx in text_lower for ctx in coding_context)
+        has_coding_context = any(ctx in text_lower for ctx in _CODING_CONTEXT)
+        
+        # Tokenize once: a word-boundary match needs every word of the keyword as a whole
+        # token, so most keywords are ruled out by set lookups instead of scanning the text
+        text_tokens = set(_TOKEN_RE.findall(text_lower))
         
         for keyword in keywords_to_check:
+            # "AmpCode" is a single token, so "amp" only requires the substring
+            if keyword != "amp" and not text_tokens.issuperset(_keyword_tokens(keyword)):
+                continue
+            # Multi-word keywords also need their words adjacent before running the regex
+            if keyword not in text_lower:
+                continue
             # Special handling for "amp" - must be capitalized and in coding context
             if keyword == "amp":
                 # Only match "Amp", "AMP", or "AmpCode" in coding context
                 if has_coding_context:
-                    if re.search(r'\b(Amp|AMP|AmpCode)\b', text):
+                    if _AMP_RE.search(text):
                         matched.append(keyword)
             # Special handling for other short ambiguous keywords
-            elif keyword in ["ai", "ml", "qa", "ci", "cd"]:
+            elif keyword in _SHORT_KEYWORDS:
                 # Use word boundaries and require some context
-                if re.search(rf'\b{re.escape(keyword.upper())}\b', text) or re.search(rf'\b{re.escape(keyword)}\b', text_lower):
+                if _keyword_pattern(keyword.upper()).search(text) or _keyword_pattern(keyword).search(text_lower):
                     matched.append(keyword)
             # All other keywords - use word boundaries to avoid matching in URLs
             else:
                 # Use word boundaries for all keywords to avoid matching in URLs/paths
-                if re.search(rf'\b{re.escape(keyword)}\b', text_lower):
+                if _keyword_pattern(keyword).search(text_lower):
                     matched.append(keyword)
         
         return matched
@@ -140,11 +226,11 @@ class KeywordFilter:
         
         return matched
     
-    def match(self, source_name: str, text: str) -> List[str]:
+    def match(self, source_name: str, text: str, text_lower: Optional[str] = None) -> List[str]:
         """
         Legacy method for backward compatibility.
         """
-        return self.match_content(source_name, text)
+        return self.match_content(source_name, text, text_lower)
     
     def is_relevant(self, source_name: str, text: str) -> bool:
         """
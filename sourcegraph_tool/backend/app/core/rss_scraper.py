@@ -6,7 +6,7 @@ from typing import List, Dict, Optional
 import logging
 from sqlalchemy.orm import Session
 from app.models import Insight
-from app.core.text_processor import TextProcessor
+from app.core.text_processor import text_processor
 from app.schemas import InsightCreate
 
 logger = logging.getLogger(__name__)
@@ -15,7 +15,7 @@ class RSSFeedScraper:
     """Scrapes RSS feeds for coding agent and dev productivity insights."""
     
     def __init__(self):
-        self.text_processor = TextProcessor()
+        self.text_processor = text_processor
         self.feeds = {
             # AI/ML Agent feeds
             "anthropic": "https://www.anthropic.com/news/rss.xml",
@@ -69,7 +69,7 @@ class RSSFeedScraper:
         try:
             async with session.get(feed_url, timeout=30) as response:
                 if response.status == 200:
-                    content = await response.text()
+                    content = await response.read()
                     feed = feedparser.parse(content)
                     
                     relevant_entries = []
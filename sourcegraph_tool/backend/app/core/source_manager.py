@@ -1,20 +1,30 @@
-import json
+import functools
+import os
 import asyncio
 import aiohttp
+import orjson
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 import logging
 from pathlib import Path
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from app.models import Insight
-from app.core.text_processor import TextProcessor
+from app.core.text_processor import text_processor
 from app.core.keyword_filter import KeywordFilter
-from app.core.tool_detector import ToolDetector
+from app.core.tool_detector import tool_detector
 from app.core.sources import BaseSource, RssSource, ArxivSource
 from app.schemas import InsightCreate
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=8)
+def _read_sources_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Read and parse a sources config file, cached per path and modification time."""
+    return orjson.loads(Path(path).read_bytes())
+
+
 class SourceManager:
     """Manages multiple data sources with modular, extensible architecture."""
     
@@ -23,14 +33,14 @@ class SourceManager:
             config_path = Path(__file__).parent / "sources.json"
         
         self.config_path = config_path
-        self.text_processor = TextProcessor()
+        self.text_processor = text_processor
         self.sources_config = self._load_sources_config()
         
         # Initialize keyword filter
         self.keyword_filter = KeywordFilter.from_config_file(keyword_config_path)
         
         # Initialize tool detector
-        self.tool_detector = ToolDetector()
+        self.tool_detector = tool_detector
         
         # Override with global keywords from sources.json if available
         global_keywords = self.sources_config.get("global_keywords", [])
@@ -54,8 +64,8 @@ class SourceManager:
     def _load_sources_config(self) -> Dict[str, Any]:
         """Load sources configuration from JSON file."""
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            # Keyed on mtime so edits to the file are picked up without a restart
+            return _read_sources_config(str(self.config_path), os.stat(self.config_path).st_mtime_ns)
         except Exception as e:
             logger.error(f"Error loading sources config: {e}")
             return {"sources": []}
@@ -172,16 +182,23 @@ class SourceManager:
         source_config: Dict[str, Any]
     ) -> int:
         """Process entries and save as insights with matched keywords tracking."""
-        count = 0
+        if not entries:
+            return 0
+        
+        # Fetch links we already have for this source in a single query
+        links = [entry['link'] for entry in entries]
+        seen_links = {
+            link for (link,) in db.query(Insight.link).filter(
+                Insight.source == source_name,
+                Insight.link.in_(links)
+            )
+        }
+        
+        rows = []
         for entry in entries:
             try:
-                # Check if we already have this insight (using unique constraint)
-                existing = db.query(Insight).filter(
-                    Insight.link == entry['link'],
-                    Insight.source == source_name
-                ).first()
-                
-                if existing:
+                # Skip insights we already have (or already queued in this batch)
+                if entry['link'] in seen_links:
                     continue
                 
                 # Create raw text for processing
@@ -213,33 +230,40 @@ class SourceManager:
                 
                 # Detect tools and concepts from matched keywords
                 matched_keywords = entry.get('matched_keywords', [])
-                mentioned_tools = self.tool_detector.detect_tools(matched_keywords)
-                mentioned_concepts = self.tool_detector.detect_concepts(matched_keywords)
-                
-                # Create database record with new fields
-                db_insight = Insight(
-                    source=source_name,
-                    mentioned_tools=mentioned_tools,
-                    mentioned_concepts=mentioned_concepts,
-                    date=insight_data.date,
-                    title=insight_data.title,
-                    summary=insight_data.summary,
-                    topics=insight_data.topics,
-                    link=insight_data.link,
-                    snippet=snippet,
-                    matched_keywords=matched_keywords,
-                    source_type=source_config.get('type', 'unknown'),
-                    tool=source_name  # Keep for backward compatibility
-                )
+                mentioned_tools, mentioned_concepts = self.tool_detector.detect(matched_keywords)
                 
-                db.add(db_insight)
-                count += 1
+                # Queue database row with new fields
+                rows.append({
+                    'source': source_name,
+                    'mentioned_tools': mentioned_tools,
+                    'mentioned_concepts': mentioned_concepts,
+                    'date': insight_data.date,
+                    'title': insight_data.title,
+                    'summary': insight_data.summary,
+                    'topics': insight_data.topics,
+                    'link': insight_data.link,
+                    'snippet': snippet,
+                    'matched_keywords': matched_keywords,
+                    'source_type': source_config.get('type', 'unknown'),
+                    'tool': source_name  # Keep for backward compatibility
+                })
+                seen_links.add(entry['link'])
                 
             except Exception as e:
                 logger.error(f"Error processing entry from {source_name}: {e}")
                 continue
         
-        if count > 0:
-            db.commit()
+        return self._bulk_insert_insights(db, rows)
+    
+    def _bulk_insert_insights(self, db: Session, rows: List[Dict[str, Any]]) -> int:
+        """Insert insight rows in one executemany, skipping existing (source, link) pairs."""
+        if not rows:
+            return 0
+        
+        stmt = sqlite_insert(Insight.__table__).on_conflict_do_nothing(
+            index_elements=['source', 'link']
+        )
+        result = db.execute(stmt, rows)
+        db.commit()
         
-        return count
+        return result.rowcount
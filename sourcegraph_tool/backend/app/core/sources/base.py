@@ -172,7 +172,7 @@ class BaseSource(ABC):
         url: str,
         timeout: int = 30,
         **kwargs
-    ) -> str:
+    ) -> bytes:
         """
         Make HTTP request with error handling.
         
@@ -183,7 +183,7 @@ class BaseSource(ABC):
             **kwargs: Additional arguments for the request
             
         Returns:
-            Response text
+            Raw response body; feedparser sniffs the encoding from the bytes
             
         Raises:
             Exception: If request fails
@@ -200,7 +200,7 @@ class BaseSource(ABC):
             timeout_config = aiohttp.ClientTimeout(total=timeout)
             async with session.get(url, timeout=timeout_config, **kwargs) as response:
                 if response.status == 200:
-                    return await response.text()
+                    return await response.read()
                 else:
                     raise Exception(f"HTTP {response.status} error for {url}")
         except asyncio.TimeoutError:
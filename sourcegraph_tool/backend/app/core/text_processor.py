@@ -1,12 +1,120 @@
+import bisect
+import functools
+import html
+import itertools
 import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Union
+from dateutil import parser as date_parser
 from app.schemas import InsightCreate
 
+_WS_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\S+')
+_SENTENCE_RE = re.compile(r'[^.]+')
+_LINK_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_URL_RE = re.compile(r'https?://\S+')
+# One pass for tags and punctuation: a tag at a position wins over its lone '<'
+_TAG_OR_PUNCT_RE = re.compile(r'<[^>]+>|[^\w\s]')
+
+# Simple date patterns
+_DATE_RES = (
+    re.compile(r'\b(\d{4}[-/]\d{1,2}[-/]\d{1,2})\b'),
+    re.compile(r'\b(\d{1,2}[-/]\d{1,2}[-/]\d{4})\b'),
+    re.compile(r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b', re.IGNORECASE),
+)
+
+# Common tech topics
+_TOPIC_KEYWORDS = [
+    "ai", "machine learning", "artificial intelligence",
+    "api", "sdk", "framework", "library",
+    "cloud", "microservices", "container",
+    "security", "authentication", "authorization",
+    "database", "sql", "nosql",
+    "frontend", "backend", "fullstack",
+    "mobile", "web", "desktop",
+    "deployment", "ci/cd", "devops",
+    "performance", "optimization", "scaling",
+    "analytics", "monitoring", "logging",
+    "testing", "automation", "integration",
+    "open source", "enterprise", "saas"
+]
+
+# (topic, display label) pairs; AI keeps its proper capitalization
+_TOPIC_LABELS = tuple(
+    (topic, "AI" if topic == "ai" else topic.title()) for topic in _TOPIC_KEYWORDS
+)
+
+# Coding-context words used to score keyword snippets
+_SNIPPET_CONTEXT_WORDS = (
+    'ai', 'artificial intelligence', 'code', 'coding', 'programming',
+    'developer', 'development', 'agent', 'agentic', 'llm', 'language model',
+    'tool', 'assistant', 'copilot', 'framework', 'library', 'ide', 'editor',
+    'automation', 'machine learning', 'model', 'github', 'cursor'
+)
+
+# Context words that indicate AI/coding relevance for score_text_relevance
+_RELEVANCE_CONTEXT_WORDS = (
+    'ai', 'artificial intelligence', 'code', 'coding', 'programming',
+    'developer', 'development', 'agent', 'agentic', 'llm', 'language model',
+    'tool', 'assistant', 'copilot', 'framework', 'library', 'ide', 'editor',
+    'automation', 'machine learning', 'neural', 'model', 'chatgpt', 'openai',
+    'github', 'cursor', 'vscode', 'replit', 'claude', 'anthropic'
+)
+
+# Markers of URL or other irrelevant snippet contexts
+_URL_ARTIFACTS = ('format=png', 'auto=webp', 'width=', 'height=', '&amp;', 'https://')
+
+# Byte patterns for the ASCII fast path of clean_text_for_search. Bytes \s is narrower
+# than str \s, which also matches the \x1c-\x1f separators, so they are spelled out
+_URL_BYTES_RE = re.compile(rb'https?://[^\s\x1c-\x1f]+')
+_TAG_OR_PUNCT_BYTES_RE = re.compile(rb'<[^>]+>|[^\w\s\x1c-\x1f]')
+_WS_BYTES_RE = re.compile(rb'[\s\x1c-\x1f]+')
+
+
+@functools.lru_cache(maxsize=256)
+def _word_pattern(word: str) -> re.Pattern:
+    """Compile a case-insensitive whole-word pattern, cached per word."""
+    return re.compile(rf'\b({re.escape(word)})\b', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _query_pattern(query: str) -> re.Pattern:
+    """Compile a case-sensitive whole-word pattern for a lowercased query, cached per query."""
+    return re.compile(rf'\b{re.escape(query)}\b')
+
+
+def _find_query_word_matches(normalized_content: str, query_words: List[str]) -> Dict[str, List[re.Match]]:
+    """Case-insensitive whole-word matches of each query word (3+ chars), keyed by word."""
+    matches = {}
+    for query_word in query_words:
+        # Skip very short words (and repeats, which cannot change the best snippet)
+        if len(query_word) < 3 or query_word in matches:
+            continue
+        matches[query_word] = list(_word_pattern(query_word).finditer(normalized_content))
+    return matches
+
+
+@dataclass(frozen=True)
+class PreparedText:
+    """A document normalized, tokenized and cleaned once for the search helpers."""
+    
+    # Spelled out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('raw', 'normalized', 'words', 'word_starts', 'cleaned', 'cleaned_lower')
+    
+    raw: str
+    normalized: str  # Whitespace-collapsed raw text
+    words: List[str]  # normalized.split()
+    word_starts: List[int]  # Offset of each word in normalized
+    cleaned: str  # clean_text_for_search(raw)
+    cleaned_lower: str
+
 
 class TextProcessor:
     """Processes raw text and extracts structured insights."""
     
+    __slots__ = ('tool_patterns', '_tool_pattern_pairs')
+    
     def __init__(self):
         self.tool_patterns = {
             "anthropic": ["anthropic", "claude", "ai assistant"],
@@ -24,18 +132,25 @@ class TextProcessor:
             "uber": ["uber", "ride sharing"],
             "airbnb": ["airbnb", "accommodation"],
         }
+        # Flattened (pattern, tool) pairs in priority order for _extract_tool
+        self._tool_pattern_pairs = tuple(
+            (pattern, tool)
+            for tool, patterns in self.tool_patterns.items()
+            for pattern in patterns
+        )
     
     def extract_insight(self, raw_text: str) -> InsightCreate:
         """Extract structured insight from raw text."""
         # Clean the text
         cleaned_text = self._clean_text(raw_text)
+        cleaned_lower = cleaned_text.lower()
         
         # Extract components
-        tool = self._extract_tool(cleaned_text)
+        tool = self._extract_tool(cleaned_text, cleaned_lower)
         date = self._extract_date(cleaned_text)
         title = self._extract_title(cleaned_text)
         summary = self._create_summary(cleaned_text)
-        topics = self._extract_topics(cleaned_text)
+        topics = self._extract_topics(cleaned_text, cleaned_lower)
         link = self._extract_link(raw_text)
         
         return InsightCreate(
@@ -50,20 +165,17 @@ class TextProcessor:
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WS_RE.sub(' ', text.strip())
         return text
     
-    def _extract_tool(self, text: str) -> str:
-        """Extract tool name from text."""
-        text_lower = text.lower()
-        
-        for tool, patterns in self.tool_patterns.items():
-            for pattern in patterns:
-                if pattern in text_lower:
-                    return tool
+    def _extract_tool(self, text: str, text_lower: str) -> str:
+        """Extract tool name from text (text_lower is text.lower())."""
+        for pattern, tool in self._tool_pattern_pairs:
+            if pattern in text_lower:
+                return tool
         
         # If no specific tool found, extract from first few words
-        words = text.split()[:10]
+        words = (m.group(0) for m in itertools.islice(_WORD_RE.finditer(text), 10))
         for word in words:
             if word.lower() in ["api", "sdk", "platform", "service", "tool"]:
                 return "unknown"
@@ -72,42 +184,32 @@ class TextProcessor:
     
     def _extract_date(self, text: str) -> datetime:
         """Extract date from text or use current date."""
-        # Simple date patterns
-        date_patterns = [
-            r'\b(\d{4}[-/]\d{1,2}[-/]\d{1,2})\b',
-            r'\b(\d{1,2}[-/]\d{1,2}[-/]\d{4})\b',
-            r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DATE_RES:
+            match = pattern.search(text)
             if match:
                 try:
-                    # Try to parse the date (simplified)
-                    return datetime.now()  # For now, return current date
-                except:
-                    continue
+                    return date_parser.parse(match.group(0))
+                except (ValueError, OverflowError):
+                    continue  # Not a real date (e.g. 2024-13-45), try the next pattern
         
         return datetime.now()
     
     def _extract_title(self, text: str) -> str:
         """Extract title from text."""
-        # Take first sentence or first 80 characters
-        sentences = text.split('.')
-        if sentences:
-            title = sentences[0].strip()
-            if len(title) > 80:
-                title = title[:77] + "..."
-            return title
-        
-        return text[:80] + "..." if len(text) > 80 else text
+        # Take first sentence, truncated to 80 characters
+        end = text.find('.')
+        title = (text if end < 0 else text[:end]).strip()
+        if len(title) > 80:
+            title = title[:77] + "..."
+        return title
     
     def _create_summary(self, text: str) -> str:
         """Create summary from text."""
         # Simple summarization - take first paragraph or first 200 chars
-        paragraphs = text.split('\n')
-        if paragraphs and len(paragraphs[0]) > 50:
-            summary = paragraphs[0]
+        end = text.find('\n')
+        first_paragraph = text if end < 0 else text[:end]
+        if len(first_paragraph) > 50:
+            summary = first_paragraph
         else:
             summary = text
         
@@ -116,38 +218,18 @@ class TextProcessor:
         
         return summary
     
-    def _extract_topics(self, text: str) -> List[str]:
-        """Extract topics/keywords from text."""
-        text_lower = text.lower()
-        
-        # Common tech topics
-        topic_keywords = [
-            "ai", "machine learning", "artificial intelligence",
-            "api", "sdk", "framework", "library",
-            "cloud", "microservices", "container",
-            "security", "authentication", "authorization",
-            "database", "sql", "nosql",
-            "frontend", "backend", "fullstack",
-            "mobile", "web", "desktop",
-            "deployment", "ci/cd", "devops",
-            "performance", "optimization", "scaling",
-            "analytics", "monitoring", "logging",
-            "testing", "automation", "integration",
-            "open source", "enterprise", "saas"
-        ]
-        
+    def _extract_topics(self, text: str, text_lower: str) -> List[str]:
+        """Extract topics/keywords from text (text_lower is text.lower())."""
         found_topics = []
-        for topic in topic_keywords:
+        for topic, label in _TOPIC_LABELS:
             if topic in text_lower:
-                # Special case for AI to keep proper capitalization
-                if topic == "ai":
-                    found_topics.append("AI")
-                else:
-                    found_topics.append(topic.title())
+                found_topics.append(label)
+                if len(found_topics) >= 5:
+                    break  # Only the first 5 topics are kept
         
         # If no topics found, extract from first few sentences
         if not found_topics:
-            words = text.split()[:50]
+            words = (m.group(0) for m in itertools.islice(_WORD_RE.finditer(text), 50))
             for word in words:
                 if len(word) > 4 and word.lower() not in ["the", "and", "for", "with", "this", "that"]:
                     found_topics.append(word.title())
@@ -158,61 +240,68 @@ class TextProcessor:
     
     def _extract_link(self, text: str) -> str:
         """Extract URL from text."""
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        match = re.search(url_pattern, text)
+        match = _LINK_RE.search(text)
         return match.group(0) if match else None
     
-    def clean_text_for_search(self, text: str) -> str:
+    def prepare(self, text: str) -> PreparedText:
+        """Normalize, tokenize and clean text once so the search helpers can share it."""
+        normalized = _WS_RE.sub(' ', text.strip())
+        cleaned = self.clean_text_for_search(text)
+        return PreparedText(
+            raw=text,
+            normalized=normalized,
+            words=normalized.split(),
+            word_starts=[m.start() for m in _WORD_RE.finditer(normalized)],
+            cleaned=cleaned,
+            cleaned_lower=cleaned.lower()
+        )
+    
+    def clean_text_for_search(self, text: Union[str, PreparedText]) -> str:
         """Clean text for contextual search by removing URLs and HTML entities."""
+        if isinstance(text, PreparedText):
+            return text.cleaned
+        
         if not text:
             return ""
         
         # HTML unescape (turns "&amp;" → "&")
-        import html
         text = html.unescape(text)
         
-        # Remove URLs
-        text = re.sub(r'https?://\S+', ' ', text)
+        # Fast path: ASCII text is cleaned as bytes (1 byte per char)
+        if text.isascii():
+            data = _URL_BYTES_RE.sub(b' ', text.encode('ascii'))
+            data = _TAG_OR_PUNCT_BYTES_RE.sub(b' ', data)
+            return _WS_BYTES_RE.sub(b' ', data).strip().decode('ascii')
         
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', text)
+        # Remove URLs
+        text = _URL_RE.sub(' ', text)
         
-        # Remove punctuation and normalize spaces
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Remove HTML tags and punctuation, then normalize spaces
+        text = _TAG_OR_PUNCT_RE.sub(' ', text)
+        text = _WS_RE.sub(' ', text).strip()
         
         return text
 
-    def score_text_relevance(self, text: str, query: str) -> float:
+    def score_text_relevance(self, text: Union[str, PreparedText], query: str) -> float:
         """Score text relevance for contextual search queries like 'Amp'."""
+        if isinstance(text, PreparedText):
+            text, clean_text = text.raw, text.cleaned_lower
+        else:
+            clean_text = None
+        
         if not query or not text:
             return 0.0
         
         # Clean text to remove URL artifacts
-        clean_text = self.clean_text_for_search(text).lower()
+        if clean_text is None:
+            clean_text = self.clean_text_for_search(text).lower()
         query_lower = query.lower()
         
-        # Context words that indicate AI/coding relevance
-        context_words = {
-            'ai', 'artificial intelligence', 'code', 'coding', 'programming', 
-            'developer', 'development', 'agent', 'agentic', 'llm', 'language model',
-            'tool', 'assistant', 'copilot', 'framework', 'library', 'ide', 'editor',
-            'automation', 'machine learning', 'neural', 'model', 'chatgpt', 'openai',
-            'github', 'cursor', 'vscode', 'replit', 'claude', 'anthropic'
-        }
-        
-        # Find occurrences of the query term as standalone words
-        import re
-        query_pattern = rf'\b{re.escape(query_lower)}\b'
-        query_matches = re.findall(query_pattern, clean_text)
-        
-        if not query_matches:
-            return 0.0
-        
+        # Score stays 0.0 when the query term never occurs
         score = 0.0
         
-        # Score each occurrence based on context
-        for match in re.finditer(query_pattern, clean_text):
+        # Score each occurrence of the query term as a standalone word
+        for match in _query_pattern(query_lower).finditer(clean_text):
             pos = match.start()
             
             # Get context window around the match (50 chars each side)
@@ -228,7 +317,7 @@ class TextProcessor:
             match_score = 10.0
             
             # Boost score for each context word found nearby
-            context_hits = sum(1 for word in context_words if word in context_window)
+            context_hits = sum(1 for word in _RELEVANCE_CONTEXT_WORDS if word in context_window)
             match_score += context_hits * 5.0
             
             # Extra boost if multiple context words appear together
@@ -239,13 +328,40 @@ class TextProcessor:
         
         return score
 
-    def extract_keyword_context_snippet(self, content: str, query: str, words_around: int = 50) -> str:
+    def find_matches(self, content: Union[str, PreparedText], query: str) -> Dict[str, List[re.Match]]:
+        """
+        Find query word occurrences once for reuse across snippet calls on the same content.
+        
+        The result can be passed as matches= to extract_keyword_context_snippet and
+        extract_relevant_snippet with the same content and query.
+        """
+        if isinstance(content, PreparedText):
+            normalized_content = content.normalized
+        else:
+            normalized_content = _WS_RE.sub(' ', (content or '').strip())
+        query_words = [w.strip().lower() for w in (query or '').split() if w.strip()]
+        return _find_query_word_matches(normalized_content, query_words)
+    
+    def extract_keyword_context_snippet(
+        self,
+        content: Union[str, PreparedText],
+        query: str,
+        words_around: int = 50,
+        matches: Dict[str, List[re.Match]] = None
+    ) -> str:
         """Extract snippet showing keyword in context with surrounding words."""
+        prepared = content if isinstance(content, PreparedText) else None
+        if prepared is not None:
+            content = prepared.raw
+        
         if not content or not query:
             return ""
         
         # Normalize text and query
-        normalized_content = re.sub(r'\s+', ' ', content.strip())
+        if prepared is not None:
+            normalized_content = prepared.normalized
+        else:
+            normalized_content = _WS_RE.sub(' ', content.strip())
         query_words = [w.strip().lower() for w in query.split() if w.strip()]
         
         if not query_words:
@@ -254,92 +370,82 @@ class TextProcessor:
         # Find all matches for any query word
         best_match = None
         best_score = 0
+        words = prepared.words if prepared is not None else None
+        word_starts = prepared.word_starts if prepared is not None else None
         
-        for query_word in query_words:
-            # Skip very short words
-            if len(query_word) < 3:
-                continue
-                
-            # Find all occurrences of this word (case insensitive)
-            pattern = rf'\b{re.escape(query_word)}\b'
-            
-            for match in re.finditer(pattern, normalized_content, re.IGNORECASE):
+        # Find all occurrences of each query word (case insensitive), unless precomputed
+        if matches is None:
+            matches = _find_query_word_matches(normalized_content, query_words)
+        
+        for query_word, word_matches in matches.items():
+            for match in word_matches:
                 match_pos = match.start()
                 match_text = match.group(0)
                 
-                # Get context around the match
-                words = normalized_content.split()
-                
-                # Find word position
-                word_positions = []
-                current_pos = 0
-                for i, word in enumerate(words):
-                    word_start = normalized_content.find(word, current_pos)
-                    word_end = word_start + len(word)
-                    word_positions.append((word_start, word_end, i))
-                    current_pos = word_end
+                # Tokenize once, on the first match
+                if words is None:
+                    words = normalized_content.split()
+                    word_starts = [m.start() for m in _WORD_RE.finditer(normalized_content)]
                 
                 # Find which word contains our match
-                match_word_idx = None
-                for word_start, word_end, word_idx in word_positions:
-                    if word_start <= match_pos < word_end:
-                        match_word_idx = word_idx
-                        break
+                match_word_idx = bisect.bisect_right(word_starts, match_pos) - 1
+                
+                # Extract surrounding words
+                start_word = max(0, match_word_idx - words_around)
+                end_word = min(len(words), match_word_idx + words_around + 1)
+                
+                context_words = words[start_word:end_word]
+                context_snippet = ' '.join(context_words)
                 
-                if match_word_idx is not None:
-                    # Extract surrounding words
-                    start_word = max(0, match_word_idx - words_around)
-                    end_word = min(len(words), match_word_idx + words_around + 1)
-                    
-                    context_words = words[start_word:end_word]
-                    context_snippet = ' '.join(context_words)
-                    
-                    # Check if this is in a URL or other irrelevant context
-                    context_lower = context_snippet.lower()
-                    if any(artifact in context_lower for artifact in [
-                        'format=png', 'auto=webp', 'width=', 'height=', '&amp;', 'https://'
-                    ]):
-                        continue  # Skip URL contexts
-                    
-                    # Score this match based on coding context
-                    context_words_set = {
-                        'ai', 'artificial intelligence', 'code', 'coding', 'programming', 
-                        'developer', 'development', 'agent', 'agentic', 'llm', 'language model',
-                        'tool', 'assistant', 'copilot', 'framework', 'library', 'ide', 'editor',
-                        'automation', 'machine learning', 'model', 'github', 'cursor'
+                # Check if this is in a URL or other irrelevant context
+                context_lower = context_snippet.lower()
+                if any(artifact in context_lower for artifact in _URL_ARTIFACTS):
+                    continue  # Skip URL contexts
+                
+                # Score this match based on coding context
+                score = sum(1 for word in _SNIPPET_CONTEXT_WORDS if word in context_lower)
+                
+                if score > best_score:
+                    best_score = score
+                    best_match = {
+                        'snippet': context_snippet,
+                        'query_word': query_word,
+                        'match_text': match_text
                     }
-                    
-                    score = sum(1 for word in context_words_set if word in context_lower)
-                    
-                    if score > best_score:
-                        best_score = score
-                        best_match = {
-                            'snippet': context_snippet,
-                            'query_word': query_word,
-                            'match_text': match_text
-                        }
         
         if best_match:
             snippet = best_match['snippet']
             query_word = best_match['query_word']
             
             # Highlight the matched term
-            pattern = rf'\b({re.escape(query_word)})\b'
-            highlighted_snippet = re.sub(pattern, r'<mark>\1</mark>', snippet, flags=re.IGNORECASE)
+            highlighted_snippet = _word_pattern(query_word).sub(r'<mark>\1</mark>', snippet)
             
             return highlighted_snippet
         
         # Fallback: no good matches found, return beginning of content
         return normalized_content[:200] + "..." if len(normalized_content) > 200 else normalized_content
 
-    def extract_relevant_snippet(self, content: str, query: str = None, max_length: int = 200, highlight: bool = True) -> str:
+    def extract_relevant_snippet(
+        self,
+        content: Union[str, PreparedText],
+        query: str = None,
+        max_length: int = 200,
+        highlight: bool = True,
+        matches: Dict[str, List[re.Match]] = None
+    ) -> str:
         """Extract most relevant snippet from content with smart contextual highlighting."""
+        prepared = content if isinstance(content, PreparedText) else None
+        if prepared is not None:
+            content = prepared.raw
+        
         if not content:
             return ""
         
         if query and highlight:
             # Use the new keyword context extraction
-            context_snippet = self.extract_keyword_context_snippet(content, query, words_around=50)
+            context_snippet = self.extract_keyword_context_snippet(
+                prepared or content, query, words_around=50, matches=matches
+            )
             if context_snippet and '<mark>' in context_snippet:
                 # Truncate if too long
                 if len(context_snippet) > max_length:
@@ -347,12 +453,14 @@ class TextProcessor:
                 return context_snippet
         
         # Fallback to original logic
-        content = re.sub(r'\s+', ' ', content.strip())
+        if prepared is not None:
+            content = prepared.normalized
+        else:
+            content = _WS_RE.sub(' ', content.strip())
         
         # Return first meaningful sentence or content chunk
-        sentences = content.split('.')
-        for sentence in sentences:
-            sentence = sentence.strip()
+        for sentence_match in _SENTENCE_RE.finditer(content):
+            sentence = sentence_match.group(0).strip()
             if len(sentence) >= 20:
                 if len(sentence) > max_length:
                     return sentence[:max_length-3] + "..."
@@ -362,3 +470,7 @@ class TextProcessor:
         if len(content) > max_length:
             return content[:max_length-3] + "..."
         return content
+
+
+# Shared instance; TextProcessor holds no per-request state
+text_processor = TextProcessor()
@@ -1,14 +1,22 @@
 """
 Tool detection utility for identifying coding agents and AI tools mentioned in content.
 """
-import json
+import functools
 import logging
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import Any, List, Dict, Set, Tuple
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _read_config(path: str) -> Dict[str, Any]:
+    """Read and parse a tool aliases config file, cached per path."""
+    return orjson.loads(Path(path).read_bytes())
+
+
 class ToolDetector:
     """
     Detects coding agents and AI tools mentioned in content.
@@ -16,6 +24,11 @@ class ToolDetector:
     Maps keyword variations to canonical tool names and concepts.
     """
     
+    __slots__ = (
+        'config_path', 'tool_aliases', 'concept_keywords',
+        '_alias_to_tools', '_keyword_to_concepts', '_all_keywords',
+    )
+    
     def __init__(self, config_path: str = None):
         """
         Initialize tool detector.
@@ -29,13 +42,15 @@ class ToolDetector:
         self.config_path = config_path
         self.tool_aliases = {}
         self.concept_keywords = {}
+        self._alias_to_tools = {}
+        self._keyword_to_concepts = {}
+        self._all_keywords = set()
         self._load_config()
     
     def _load_config(self):
         """Load tool aliases configuration from JSON file."""
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            config = _read_config(str(self.config_path))
             
             self.tool_aliases = config.get("tool_aliases", {})
             self.concept_keywords = config.get("concept_keywords", {})
@@ -46,6 +61,21 @@ class ToolDetector:
             logger.error(f"Error loading tool aliases config from {self.config_path}: {e}")
             self.tool_aliases = {}
             self.concept_keywords = {}
+        
+        self._alias_to_tools = self._build_reverse_index(self.tool_aliases)
+        self._keyword_to_concepts = self._build_reverse_index(self.concept_keywords)
+        self._all_keywords = set(self._alias_to_tools) | set(self._keyword_to_concepts)
+    
+    @staticmethod
+    def _build_reverse_index(mapping: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Map each lowercased alias to the canonical names that list it."""
+        index = {}
+        for canonical, aliases in mapping.items():
+            for alias in aliases:
+                names = index.setdefault(alias.lower(), [])
+                if canonical not in names:
+                    names.append(canonical)
+        return index
     
     def detect_tools(self, matched_keywords: List[str]) -> List[str]:
         """
@@ -59,15 +89,9 @@ class ToolDetector:
         """
         detected_tools = set()
         
-        # Convert keywords to lowercase for case-insensitive matching
-        keywords_lower = [k.lower() for k in matched_keywords]
-        
-        # Check each tool's aliases
-        for canonical_tool, aliases in self.tool_aliases.items():
-            for alias in aliases:
-                if alias.lower() in keywords_lower:
-                    detected_tools.add(canonical_tool)
-                    break  # Found a match for this tool, move to next
+        # Look up each lowercased keyword in the alias index
+        for keyword in matched_keywords:
+            detected_tools.update(self._alias_to_tools.get(keyword.lower(), ()))
         
         return list(detected_tools)
     
@@ -83,29 +107,53 @@ class ToolDetector:
         """
         detected_concepts = set()
         
-        # Convert keywords to lowercase for case-insensitive matching
-        keywords_lower = [k.lower() for k in matched_keywords]
-        
-        # Check each concept's keywords
-        for canonical_concept, keywords in self.concept_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in keywords_lower:
-                    detected_concepts.add(canonical_concept)
-                    break  # Found a match for this concept, move to next
+        # Look up each lowercased keyword in the concept index
+        for keyword in matched_keywords:
+            detected_concepts.update(self._keyword_to_concepts.get(keyword.lower(), ()))
         
         return list(detected_concepts)
     
-    def get_all_tool_keywords(self) -> Set[str]:
-        """Get all tool-related keywords for filtering."""
-        all_keywords = set()
+    def detect(self, matched_keywords: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Detect tools and concepts from matched keywords in a single pass.
+        
+        Args:
+            matched_keywords: List of matched keywords from keyword filter
+            
+        Returns:
+            A (tools, concepts) tuple, as detect_tools and detect_concepts would return
+        """
+        return self.detect_batch([matched_keywords])[0]
+    
+    def detect_batch(self, keyword_lists: List[List[str]]) -> List[Tuple[List[str], List[str]]]:
+        """
+        Detect tools and concepts for many matched keyword lists in one pass.
         
-        for aliases in self.tool_aliases.values():
-            all_keywords.update(alias.lower() for alias in aliases)
+        Args:
+            keyword_lists: One list of matched keywords per item
+            
+        Returns:
+            A (tools, concepts) tuple per input list, in input order
+        """
+        alias_to_tools = self._alias_to_tools
+        keyword_to_concepts = self._keyword_to_concepts
+        results = []
         
-        for keywords in self.concept_keywords.values():
-            all_keywords.update(keyword.lower() for keyword in keywords)
+        for matched_keywords in keyword_lists:
+            detected_tools = set()
+            detected_concepts = set()
+            for keyword in matched_keywords:
+                keyword = keyword.lower()
+                detected_tools.update(alias_to_tools.get(keyword, ()))
+                detected_concepts.update(keyword_to_concepts.get(keyword, ()))
+            results.append((list(detected_tools), list(detected_concepts)))
         
-        return all_keywords
+        return results
+    
+    def get_all_tool_keywords(self) -> Set[str]:
+        """Get all tool-related keywords for filtering."""
+        # Copy so callers can't mutate the cached set
+        return set(self._all_keywords)
     
     def get_canonical_tools(self) -> List[str]:
         """Get list of all canonical tool names."""
@@ -114,3 +162,7 @@ class ToolDetector:
     def get_canonical_concepts(self) -> List[str]:
         """Get list of all canonical concept names."""
         return list(self.concept_keywords.keys())
+
+
+# Shared instance so the aliases config is read once per process
+tool_detector = ToolDetector()
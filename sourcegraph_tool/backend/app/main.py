@@ -1,12 +1,41 @@
+from contextlib import asynccontextmanager
+from typing import Any
+
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
 
 from app.api import insights_router
+from app.db import engine
+from app.models import Base
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create tables on startup rather than as an import side effect
+    Base.metadata.create_all(bind=engine)
+    # Warm one pooled connection so the PRAGMAs are applied before the first request
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    yield
+
 
 app = FastAPI(
     title="Agentic Insight Tracker",
     description="API for tracking and analyzing AI agent insights from blogs and changelogs",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -18,6 +47,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses; tiny payloads like /health are left as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(insights_router)
 
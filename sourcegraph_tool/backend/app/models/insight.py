@@ -32,4 +32,6 @@ class Insight(Base):
     __table_args__ = (
         Index('ix_insights_source_link', 'source', 'link', unique=True),  # Prevent duplicates
         Index('ix_insights_tool_link', 'tool', 'link'),  # Legacy index for backward compatibility
+        Index('ix_insights_tool_date', 'tool', 'date'),  # Tool filter + date range/order
+        Index('ix_insights_source_date', 'source', 'date'),  # Source filter + date range/order
     )
@@ -10,10 +10,10 @@ This script adds new columns and migrates existing data:
 """
 
 import sys
-import json
 import logging
 from pathlib import Path
-from sqlalchemy import create_engine, MetaData, Table, Column, String, JSON, Index, text
+from typing import List
+from sqlalchemy import create_engine, event, MetaData, Table, Column, String, JSON, Index, text
 from sqlalchemy.orm import sessionmaker
 
 # Add the backend directory to Python path
@@ -21,12 +21,131 @@ backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
 from app.db.database import DATABASE_URL
-from app.core.tool_detector import ToolDetector
+from app.core.tool_detector import tool_detector
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bulk-write tuning applied to each migration connection (all per-connection except WAL,
+# which the app uses as well)
+MIGRATION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA mmap_size=268435456',  # 256 MB
+    'PRAGMA cache_size=-200000',  # ~200 MB
+    'PRAGMA temp_store=MEMORY',
+)
+
+# Rows without any matched keywords get empty tools/concepts directly in SQL
+MIGRATE_EMPTY_KEYWORDS_SQL = text('''
+    UPDATE insights 
+    SET source = COALESCE(NULLIF(tool, ''), 'unknown'), 
+        mentioned_tools = '[]', 
+        mentioned_concepts = '[]'
+    WHERE source IS NULL
+      AND (matched_keywords IS NULL OR matched_keywords IN ('', '[]', 'null'))
+''')
+
+# Rows whose matched_keywords is a JSON array of strings are resolved entirely in SQLite
+# (JSON1) against a temporary keyword -> canonical name table built from the tool detector
+CREATE_KEYWORD_MAP_SQL = text('''
+    CREATE TEMP TABLE migration_keyword_map (
+        keyword TEXT NOT NULL,
+        name TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        PRIMARY KEY (kind, keyword, name)
+    )
+''')
+
+INSERT_KEYWORD_MAP_SQL = text('''
+    INSERT OR IGNORE INTO migration_keyword_map (keyword, name, kind)
+    VALUES (:keyword, :name, :kind)
+''')
+
+MIGRATE_KEYWORDS_SQL = text('''
+    UPDATE insights 
+    SET source = COALESCE(NULLIF(tool, ''), 'unknown'), 
+        mentioned_tools = (
+            SELECT json_group_array(DISTINCT m.name)
+            FROM json_each(insights.matched_keywords) AS k
+            JOIN migration_keyword_map AS m ON m.kind = 'tool' AND m.keyword = lower(k.value)
+        ), 
+        mentioned_concepts = (
+            SELECT json_group_array(DISTINCT m.name)
+            FROM json_each(insights.matched_keywords) AS k
+            JOIN migration_keyword_map AS m ON m.kind = 'concept' AND m.keyword = lower(k.value)
+        )
+    WHERE source IS NULL
+      AND json_valid(matched_keywords)
+      AND json_type(matched_keywords) = 'array'
+      AND NOT EXISTS (
+          SELECT 1 FROM json_each(insights.matched_keywords) WHERE type != 'text'
+      )
+''')
+
+# Columns rewritten by the data migration; indexes covering them are rebuilt afterwards
+MIGRATED_COLUMNS = {'source', 'mentioned_tools', 'mentioned_concepts'}
+
+# Whatever is still unmigrated after the two statements above has matched_keywords that
+# are not a JSON array of strings, so no keywords can be detected for it
+SELECT_MALFORMED_KEYWORDS_SQL = text('''
+    SELECT id, matched_keywords FROM insights
+    WHERE source IS NULL
+    ORDER BY id
+''')
+
+MIGRATE_MALFORMED_KEYWORDS_SQL = text('''
+    UPDATE insights 
+    SET source = COALESCE(NULLIF(tool, ''), 'unknown'), 
+        mentioned_tools = '[]', 
+        mentioned_concepts = '[]'
+    WHERE source IS NULL
+''')
+
+
+def _migrate_keywords_in_sql(session) -> int:
+    """Resolve tools/concepts for well-formed matched_keywords arrays in SQL, returning the rows updated."""
+    session.execute(CREATE_KEYWORD_MAP_SQL)
+    keyword_map = [
+        {'keyword': keyword.lower(), 'name': name, 'kind': kind}
+        for kind, mapping in (('tool', tool_detector.tool_aliases), ('concept', tool_detector.concept_keywords))
+        for name, keywords in mapping.items()
+        for keyword in keywords
+    ]
+    if keyword_map:
+        session.execute(INSERT_KEYWORD_MAP_SQL, keyword_map)
+    
+    try:
+        return session.execute(MIGRATE_KEYWORDS_SQL).rowcount
+    finally:
+        session.execute(text('DROP TABLE migration_keyword_map'))
+
+
+def _drop_indexes_on(session, columns) -> List[str]:
+    """
+    Drop explicit non-unique indexes on insights that cover any of columns, returning their CREATE statements.
+    
+    UNIQUE indexes are kept so a migrated row that would duplicate a key fails the
+    UPDATE itself, rather than the rebuild after the data has already changed.
+    """
+    dropped = []
+    indexes = session.execute(text(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = 'insights' AND sql IS NOT NULL"
+    )).fetchall()
+    
+    for name, create_sql in indexes:
+        if create_sql.lstrip().upper().startswith('CREATE UNIQUE'):
+            continue
+        indexed_columns = {row[2] for row in session.execute(text(f'PRAGMA index_info("{name}")'))}
+        if indexed_columns & columns:
+            logger.info(f"Dropping index {name} until the data migration finishes...")
+            session.execute(text(f'DROP INDEX "{name}"'))
+            dropped.append(create_sql)
+    
+    return dropped
+
 
 def migrate_database():
     """Perform database migration to new schema."""
@@ -35,6 +154,13 @@ def migrate_database():
     database_url = DATABASE_URL
     engine = create_engine(database_url)
     
+    @event.listens_for(engine, "connect")
+    def _set_migration_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in MIGRATION_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+    
     # Create session
     Session = sessionmaker(bind=engine)
     session = Session()
@@ -42,6 +168,9 @@ def migrate_database():
     try:
         logger.info("Starting database migration...")
         
+        # Run the whole migration in one write transaction (single COMMIT/fsync)
+        session.execute(text('BEGIN IMMEDIATE'))
+        
         # Check existing columns using raw SQL
         result = session.execute(text('PRAGMA table_info(insights)'))
         existing_columns = [row[1] for row in result.fetchall()]
@@ -51,92 +180,78 @@ def migrate_database():
         if 'source' not in existing_columns:
             logger.info("Adding 'source' column...")
             session.execute(text('ALTER TABLE insights ADD COLUMN source TEXT'))
-            session.commit()
         
         if 'mentioned_tools' not in existing_columns:
             logger.info("Adding 'mentioned_tools' column...")
             session.execute(text('ALTER TABLE insights ADD COLUMN mentioned_tools TEXT'))  # SQLite doesn't have JSON type
-            session.commit()
         
         if 'mentioned_concepts' not in existing_columns:
             logger.info("Adding 'mentioned_concepts' column...")
             session.execute(text('ALTER TABLE insights ADD COLUMN mentioned_concepts TEXT'))  # SQLite doesn't have JSON type
-            session.commit()
         
         # Migrate existing data
         logger.info("Migrating existing data...")
         
-        # Initialize tool detector for processing existing records
-        tool_detector = ToolDetector()
-        
-        # Get all existing records
-        result = session.execute(text('SELECT id, tool, matched_keywords FROM insights WHERE source IS NULL'))
-        records_to_update = result.fetchall()
-        
-        logger.info(f"Found {len(records_to_update)} records to migrate")
-        
-        # Process each record
-        updated_count = 0
-        for record in records_to_update:
-            record_id, tool_value, matched_keywords_json = record
-            
-            # Set source from existing tool field
-            source = tool_value or "unknown"
-            
-            # Extract mentioned tools and concepts from matched keywords
-            mentioned_tools = []
-            mentioned_concepts = []
-            
-            if matched_keywords_json:
-                try:
-                    if isinstance(matched_keywords_json, str):
-                        matched_keywords = json.loads(matched_keywords_json)
-                    else:
-                        matched_keywords = matched_keywords_json or []
-                    
-                    mentioned_tools = tool_detector.detect_tools(matched_keywords)
-                    mentioned_concepts = tool_detector.detect_concepts(matched_keywords)
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing matched_keywords for record {record_id}: {e}")
-                    matched_keywords = []
-            
-            # Update record
-            session.execute(text('''
-                UPDATE insights 
-                SET source = :source, 
-                    mentioned_tools = :mentioned_tools, 
-                    mentioned_concepts = :mentioned_concepts
-                WHERE id = :record_id
-            '''), {
-                'source': source,
-                'mentioned_tools': json.dumps(mentioned_tools),
-                'mentioned_concepts': json.dumps(mentioned_concepts),
-                'record_id': record_id
-            })
-            
-            updated_count += 1
-            
-            if updated_count % 100 == 0:
-                logger.info(f"Migrated {updated_count} records...")
-                session.commit()
-        
-        # Final commit
-        session.commit()
+        # Count first so the rows themselves can be read in pages instead of fetched at once
+        records_to_migrate = session.execute(
+            text('SELECT COUNT(*) FROM insights WHERE source IS NULL')
+        ).scalar()
+        
+        logger.info(f"Found {records_to_migrate} records to migrate")
+        
+        # Updating indexed columns row by row maintains every index on them; rebuild them once instead
+        dropped_indexes = _drop_indexes_on(session, MIGRATED_COLUMNS) if records_to_migrate else []
+        
+        # Rows with no keywords need no detection, so handle them in one statement
+        updated_count = session.execute(MIGRATE_EMPTY_KEYWORDS_SQL).rowcount if records_to_migrate else 0
+        logger.info(f"Migrated {updated_count} records without matched keywords in SQL")
+        
+        # Well-formed keyword arrays are mapped to tools/concepts in SQL as well
+        if records_to_migrate:
+            keyword_count = _migrate_keywords_in_sql(session)
+            updated_count += keyword_count
+            logger.info(f"Migrated {keyword_count} records with matched keywords in SQL")
+        
+        # Remaining rows have malformed keywords: log each, then give them empty tools/concepts
+        if records_to_migrate:
+            for record_id, matched_keywords_json in session.execute(SELECT_MALFORMED_KEYWORDS_SQL).fetchall():
+                logger.warning(
+                    f"Error processing matched_keywords for record {record_id}: "
+                    f"expected a JSON list of strings, got {matched_keywords_json!r}"
+                )
+            malformed_count = session.execute(MIGRATE_MALFORMED_KEYWORDS_SQL).rowcount
+            updated_count += malformed_count
+            logger.info(f"Migrated {malformed_count} records with malformed matched keywords in SQL")
+        
         logger.info(f"Migration completed. Updated {updated_count} records.")
         
+        # Rebuild the indexes dropped before the data migration; a failure rolls back the migration
+        for create_sql in dropped_indexes:
+            session.execute(text(create_sql))
+        
         # Create new index for source + link uniqueness
         try:
             logger.info("Creating new index for source + link uniqueness...")
             session.execute(text('CREATE UNIQUE INDEX IF NOT EXISTS ix_insights_source_link ON insights (source, link)'))
-            session.commit()
             logger.info("New index created successfully.")
         except Exception as e:
             logger.warning(f"Index creation failed (may already exist): {e}")
         
+        # Create composite indexes for filtered date-range queries
+        try:
+            logger.info("Creating composite indexes for tool/source + date queries...")
+            session.execute(text('CREATE INDEX IF NOT EXISTS ix_insights_tool_date ON insights (tool, date)'))
+            session.execute(text('CREATE INDEX IF NOT EXISTS ix_insights_source_date ON insights (source, date)'))
+            logger.info("Composite indexes created successfully.")
+        except Exception as e:
+            logger.warning(f"Index creation failed (may already exist): {e}")
+        
         # SQLite doesn't support ALTER COLUMN SET NOT NULL directly, so we'll skip this step
         logger.info("Note: Skipping NOT NULL constraint for SQLite compatibility")
         
+        # Commit schema changes, data migration and indexes together
+        session.commit()
+        
         logger.info("Database migration completed successfully!")
         return True
         
@@ -2,33 +2,59 @@
 """
 Comprehensive test of the enhanced Agentic Insight Tracker API.
 """
-import requests
+import asyncio
+import aiohttp
 import json
 
 BASE_URL = "http://127.0.0.1:8000"
 
-def test_endpoint(endpoint, params=None):
+async def test_endpoint(session, endpoint, params=None):
     """Test an API endpoint and return the response."""
     url = f"{BASE_URL}{endpoint}"
     try:
-        response = requests.get(url, params=params)
-        return response.status_code, response.json()
+        async with session.get(url, params=params) as response:
+            return response.status, await response.json(content_type=None)
     except Exception as e:
         return None, str(e)
 
-def main():
+async def main():
     print("🚀 Testing Enhanced Agentic Insight Tracker API")
     print("=" * 60)
     
+    # The probes are independent, so issue them all at once and report in order
+    async with aiohttp.ClientSession() as session:
+        (
+            health,
+            keyword_filter,
+            source_type_filter,
+            keywords_result,
+            source_types_result,
+            sources_result,
+            combined_filter,
+        ) = await asyncio.gather(
+            test_endpoint(session, "/health"),
+            test_endpoint(session, "/api/insights", {"matched_keywords": "claude,copilot", "limit": 2}),
+            test_endpoint(session, "/api/insights", {"source_type": "rss", "limit": 3}),
+            test_endpoint(session, "/api/insights/keywords"),
+            test_endpoint(session, "/api/insights/source-types"),
+            test_endpoint(session, "/api/insights/sources"),
+            test_endpoint(session, "/api/insights", {
+                "matched_keywords": "ai",
+                "source_type": "rss",
+                "from_hours": 24,
+                "limit": 3
+            }),
+        )
+    
     # Test health endpoint
-    status, data = test_endpoint("/health")
+    status, data = health
     print(f"✅ Health check: {status} - {data}")
     
     # Test enhanced insights endpoint with new filters
     print("\n📊 Testing enhanced insights filtering...")
     
     # Test matched keywords filter
-    status, data = test_endpoint("/api/insights", {"matched_keywords": "claude,copilot", "limit": 2})
+    status, data = keyword_filter
     if status == 200:
         print(f"✅ Keyword filter: Found {len(data)} insights with claude/copilot keywords")
         if data:
@@ -38,7 +64,7 @@ def main():
         print(f"❌ Keyword filter failed: {status}")
     
     # Test source type filter
-    status, data = test_endpoint("/api/insights", {"source_type": "rss", "limit": 3})
+    status, data = source_type_filter
     if status == 200:
         print(f"✅ Source type filter: Found {len(data)} RSS insights")
     else:
@@ -48,7 +74,7 @@ def main():
     print("\n🔍 Testing new metadata endpoints...")
     
     # Test keywords endpoint
-    status, keywords = test_endpoint("/api/insights/keywords")
+    status, keywords = keywords_result
     if status == 200:
         print(f"✅ Keywords endpoint: {len(keywords)} unique keywords")
         print(f"   Sample keywords: {keywords[:5]}")
@@ -56,14 +82,14 @@ def main():
         print(f"❌ Keywords endpoint failed: {status}")
     
     # Test source types endpoint
-    status, source_types = test_endpoint("/api/insights/source-types")
+    status, source_types = source_types_result
     if status == 200:
         print(f"✅ Source types endpoint: {source_types}")
     else:
         print(f"❌ Source types endpoint failed: {status}")
     
     # Test sources endpoint (existing)
-    status, sources = test_endpoint("/api/insights/sources")
+    status, sources = sources_result
     if status == 200:
         print(f"✅ Sources endpoint: {len(sources)} configured sources")
         print(f"   New sources added: {[s for s in sources if 'reddit' in s or 'dev_to' in s or 'arxiv' in s or 'medium' in s]}")
@@ -73,12 +99,7 @@ def main():
     # Test combined filtering
     print("\n🎯 Testing advanced filtering combinations...")
     
-    status, data = test_endpoint("/api/insights", {
-        "matched_keywords": "ai",
-        "source_type": "rss",
-        "from_hours": 24,
-        "limit": 3
-    })
+    status, data = combined_filter
     if status == 200:
         print(f"✅ Combined filtering: Found {len(data)} recent AI insights from RSS sources")
         for i, insight in enumerate(data[:2]):
@@ -91,4 +112,4 @@ def main():
     print("✅ Enhanced API testing completed!")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -4,7 +4,9 @@ Test script for the enhanced ingestion system with keyword filtering.
 """
 import sys
 import asyncio
+import functools
 import logging
+import aiohttp
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -19,6 +21,12 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_keyword_filter() -> KeywordFilter:
+    """Load the configured keyword filter once; the source handlers only read from it."""
+    return KeywordFilter.from_config_file()
+
+
 async def test_keyword_filter():
     """Test the KeywordFilter functionality."""
     print("=" * 50)
@@ -41,8 +49,13 @@ async def test_keyword_filter():
         ("GitHub Copilot integration", "other_source", ["copilot"]),
     ]
     
-    for text, source, expected_keywords in test_cases:
-        matched = keyword_filter.match(source, text)
+    # Match all test cases in one call
+    all_matched = keyword_filter.match_bulk_by_source(
+        [source for _, source, _ in test_cases],
+        [text for text, _, _ in test_cases]
+    )
+    
+    for (text, source, expected_keywords), matched in zip(test_cases, all_matched):
         matched_set = set(matched)
         expected_set = set(expected_keywords)
         
@@ -54,14 +67,14 @@ async def test_keyword_filter():
         print("-" * 30)
 
 
-async def test_rss_source():
+async def test_rss_source(session: aiohttp.ClientSession):
     """Test RSS source with keyword filtering."""
     print("=" * 50)
     print("Testing RSS Source with Keyword Filtering")
     print("=" * 50)
     
     # Create keyword filter
-    keyword_filter = KeywordFilter.from_config_file()
+    keyword_filter = _get_keyword_filter()
     
     # Test RSS source configuration
     source_config = {
@@ -85,14 +98,11 @@ async def test_rss_source():
     print(f"RSS Source Info: {rss_source.get_source_info()}")
     
     try:
-        import aiohttp
-        
         # Test fetching (limit to last 1 hour to avoid too many results)
         cutoff_time = datetime.now() - timedelta(hours=1)
         
-        async with aiohttp.ClientSession() as session:
-            entries = await rss_source.fetch(session, cutoff_time)
-            
+        entries = await rss_source.fetch(session, cutoff_time)
+        
         print(f"Found {len(entries)} entries from RSS feed")
         
         # Show first few entries
@@ -107,14 +117,14 @@ async def test_rss_source():
         print(f"RSS test failed: {e}")
 
 
-async def test_arxiv_source():
+async def test_arxiv_source(session: aiohttp.ClientSession):
     """Test arXiv source with keyword filtering."""
     print("=" * 50)
     print("Testing arXiv Source with Keyword Filtering")
     print("=" * 50)
     
     # Create keyword filter
-    keyword_filter = KeywordFilter.from_config_file()
+    keyword_filter = _get_keyword_filter()
     
     # Test arXiv source configuration
     source_config = {
@@ -135,14 +145,11 @@ async def test_arxiv_source():
     print(f"arXiv Source Info: {arxiv_source.get_source_info()}")
     
     try:
-        import aiohttp
-        
         # Test fetching (limit to last 7 days)
         cutoff_time = datetime.now() - timedelta(days=7)
         
-        async with aiohttp.ClientSession() as session:
-            entries = await arxiv_source.fetch(session, cutoff_time)
-            
+        entries = await arxiv_source.fetch(session, cutoff_time)
+        
         print(f"Found {len(entries)} papers from arXiv")
         
         # Show first few entries
@@ -165,8 +172,12 @@ async def main():
     
     try:
         await test_keyword_filter()
-        await test_rss_source()
-        await test_arxiv_source()
+        
+        # One session (connector, DNS cache, SSL context) shared by both source tests
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await test_rss_source(session)
+            await test_arxiv_source(session)
         
         print("\n" + "=" * 60)
         print("✅ All tests completed!")
@@ -6,17 +6,38 @@ Tests all RSS feeds from sources.json file to check their availability and parsa
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import feedparser
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+from xml.etree import ElementTree
+from urllib.parse import urlparse
 import os
 import sys
 
 # Add the backend directory to the path so we can import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
+# Number of feeds tested concurrently
+MAX_WORKERS = 16
+
+# Maximum (decompressed) bytes of each feed handed to the parser
+MAX_FEED_BYTES = 2_000_000
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+
+# Shared session so connections to hosts serving several feeds are kept alive and reused
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=1)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
 def load_sources(sources_path: str) -> List[Dict[str, Any]]:
     """Load RSS sources from sources.json file."""
     try:
@@ -30,6 +51,64 @@ def load_sources(sources_path: str) -> List[Dict[str, Any]]:
         print(f"Error: Invalid JSON in sources file: {e}")
         return []
 
+def parse_iso_date(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting the trailing 'Z' older Pythons reject."""
+    if value[-1:] in ('Z', 'z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+def parse_feed_summary(body: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Extract feed title, entry count and last update from well-formed RSS 2.0 or Atom XML.
+    
+    Uses the C-accelerated stdlib XML parser; returns None for anything else
+    (RSS 1.0/RDF, malformed or truncated XML, or no parseable feed date) so the
+    caller can fall back to feedparser.
+    """
+    try:
+        root = ElementTree.fromstring(body)
+    except ElementTree.ParseError:
+        return None
+    
+    if root.tag == 'rss':
+        channel = root.find('channel')
+        if channel is None:
+            return None
+        title = channel.findtext('title', 'No title')
+        entry_count = len(channel.findall('item'))
+        # Same precedence as feedparser's updated: lastBuildDate, then pubDate, then dc:date
+        updated = channel.findtext('lastBuildDate') or channel.findtext('pubDate')
+        parse_date = parsedate_to_datetime
+        if not updated:
+            updated = channel.findtext(f'{DC_NS}date')
+            parse_date = parse_iso_date
+    elif root.tag == f'{ATOM_NS}feed':
+        title = root.findtext(f'{ATOM_NS}title', 'No title')
+        entry_count = len(root.findall(f'{ATOM_NS}entry'))
+        updated = root.findtext(f'{ATOM_NS}updated')
+        parse_date = parse_iso_date
+    else:
+        return None
+    
+    # Leave dateless or oddly dated feeds to feedparser, which knows more fallbacks and formats
+    if not updated or not updated.strip():
+        return None
+    try:
+        updated_at = parse_date(updated.strip())
+    except (TypeError, ValueError):
+        return None
+    
+    # Report the last update in UTC, like feedparser's updated_parsed
+    if updated_at.tzinfo is not None:
+        updated_at = updated_at.astimezone(timezone.utc)
+    last_updated = updated_at.strftime('%Y-%m-%d %H:%M:%S')
+    
+    return {
+        'feed_title': title.strip(),
+        'entry_count': entry_count,
+        'last_updated': last_updated
+    }
+
 def test_rss_feed(source: Dict[str, Any], timeout: int = 30) -> Dict[str, Any]:
     """Test a single RSS feed and return results."""
     name = source.get('name', 'Unknown')
@@ -57,14 +136,18 @@ def test_rss_feed(source: Dict[str, Any], timeout: int = 30) -> Dict[str, Any]:
         result['error'] = 'No endpoint specified'
         return result
     
-    print(f"Testing {name}: {endpoint}")
-    
     try:
         # Make HTTP request with timeout
         start_time = time.time()
-        response = requests.get(endpoint, timeout=timeout, headers={
-            'User-Agent': 'Mozilla/5.0 (RSS Feed Tester)'
+        response = SESSION.get(endpoint, timeout=timeout, stream=True, headers={
+            'User-Agent': 'Mozilla/5.0 (RSS Feed Tester)',
+            'Accept-Encoding': 'gzip, deflate'
         })
+        try:
+            # Parsability only needs the head of the feed, so cap the bytes read
+            body = response.raw.read(MAX_FEED_BYTES, decode_content=True) if response.status_code == 200 else b''
+        finally:
+            response.close()
         response_time = time.time() - start_time
         
         result['status_code'] = response.status_code
@@ -74,23 +157,28 @@ def test_rss_feed(source: Dict[str, Any], timeout: int = 30) -> Dict[str, Any]:
             result['error'] = f'HTTP {response.status_code}: {response.reason}'
             return result
         
-        # Try to parse with feedparser
+        # Try the fast XML summary first, falling back to feedparser for anything unusual
         try:
-            feed = feedparser.parse(response.content)
-            
-            if feed.bozo:
-                result['error'] = f'Feed parse error: {feed.bozo_exception}'
-                # Continue even if bozo, as many feeds still work
-            
-            result['can_parse'] = True
-            result['entry_count'] = len(feed.entries)
-            
-            # Extract feed metadata
-            if hasattr(feed, 'feed'):
-                result['feed_title'] = feed.feed.get('title', 'No title')
-                if hasattr(feed.feed, 'updated_parsed') and feed.feed.updated_parsed:
-                    result['last_updated'] = time.strftime('%Y-%m-%d %H:%M:%S', 
-                                                         feed.feed.updated_parsed)
+            summary = parse_feed_summary(body)
+            if summary is not None:
+                result['can_parse'] = True
+                result.update(summary)
+            else:
+                feed = feedparser.parse(body)
+                
+                if feed.bozo:
+                    result['error'] = f'Feed parse error: {feed.bozo_exception}'
+                    # Continue even if bozo, as many feeds still work
+                
+                result['can_parse'] = True
+                result['entry_count'] = len(feed.entries)
+                
+                # Extract feed metadata
+                if hasattr(feed, 'feed'):
+                    result['feed_title'] = feed.feed.get('title', 'No title')
+                    if hasattr(feed.feed, 'updated_parsed') and feed.feed.updated_parsed:
+                        result['last_updated'] = time.strftime('%Y-%m-%d %H:%M:%S', 
+                                                             feed.feed.updated_parsed)
             
             # Check if we actually got entries
             if result['entry_count'] == 0:
@@ -181,23 +269,31 @@ def main():
     print(f"Found {len(sources)} RSS sources to test")
     print("-" * 50)
     
-    # Test each feed
+    # Test feeds concurrently, keeping at most one request in flight per host
+    host_locks = {
+        urlparse(source.get('endpoint', '')).netloc: threading.Semaphore(1)
+        for source in sources
+    }
+    
+    def test_with_host_limit(source: Dict[str, Any]) -> Dict[str, Any]:
+        with host_locks[urlparse(source.get('endpoint', '')).netloc]:
+            return test_rss_feed(source)
+    
     results = []
-    for i, source in enumerate(sources, 1):
-        print(f"[{i}/{len(sources)}] ", end="")
-        result = test_rss_feed(source)
-        results.append(result)
-        
-        # Brief status update
-        if result['can_parse'] and result['entry_count'] > 0:
-            print(f"✅ OK ({result['entry_count']} entries)")
-        elif not result['enabled']:
-            print("⚪ DISABLED")
-        else:
-            print(f"❌ FAILED: {result['error']}")
-        
-        # Small delay to be respectful to servers
-        time.sleep(0.5)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(test_with_host_limit, source) for source in sources]
+        for i, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results.append(result)
+            
+            # Brief status update
+            if result['can_parse'] and result['entry_count'] > 0:
+                status = f"✅ OK ({result['entry_count']} entries)"
+            elif not result['enabled']:
+                status = "⚪ DISABLED"
+            else:
+                status = f"❌ FAILED: {result['error']}"
+            print(f"[{i}/{len(sources)}] {result['name']}: {status}")
     
     # Generate and save report
     report = generate_report(results)
@@ -58,7 +58,9 @@ def main():
             print(f"   {i+1}. {insight['tool']}: \"{insight['title'][:50]}...\"")
             if 'cody' in insight['title'].lower():
                 print("      ✅ Found 'cody' in title")
-            if insight.get('matched_keywords') and any('cody' in kw.lower() for kw in insight['matched_keywords']):
+            # Lowercase the keywords once; joining keeps the substring semantics
+            keywords_lc = '\n'.join(insight.get('matched_keywords') or []).lower()
+            if 'cody' in keywords_lc:
                 print("      ✅ Found 'cody' in matched keywords")
     else:
         print(f"❌ Cody search failed: {status}")
@@ -99,8 +101,9 @@ def main():
         print(f"✅ Matched keywords filter: Found {len(data)} insights")
         for insight in data[:2]:
             keywords = insight.get('matched_keywords', [])
-            has_claude = any('claude' in kw.lower() for kw in keywords)
-            has_cody = any('cody' in kw.lower() for kw in keywords)
+            keywords_lc = '\n'.join(keywords or []).lower()
+            has_claude = 'claude' in keywords_lc
+            has_cody = 'cody' in keywords_lc
             print(f"   Keywords: {keywords} (Claude: {has_claude}, Cody: {has_cody})")
     else:
         print(f"❌ Matched keywords filter failed: {status}")
@@ -6,140 +6,287 @@ Test script to specifically check the Sourcegraph feed and debugging.
 import asyncio
 import aiohttp
 import feedparser
-import json
+import heapq
+import io
+import orjson
 import sys
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 
-# Add the backend directory to Python path
-backend_dir = Path(__file__).parent
-sys.path.insert(0, str(backend_dir))
+# Add the backend directory to Python path (once)
+backend_dir = Path(__file__).resolve().parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
 
 from app.core.source_manager import SourceManager
 from app.core.keyword_filter import KeywordFilter
-from app.core.tool_detector import ToolDetector
+from app.core.tool_detector import tool_detector
 
+# Maximum concurrent feed requests
+MAX_CONCURRENT_FETCHES = 5
 
-async def test_sourcegraph_feed():
+# The test only looks at the first few entries, so only those are parsed
+SAMPLE_ENTRIES = 3
+
+# Conditional GET validators and parsed entries from the last successful fetch
+FEED_CACHE_PATH = backend_dir / ".feed_cache" / "sourcegraph.json"
+CACHED_ENTRY_FIELDS = ('title', 'summary', 'link', 'published', 'content')
+
+
+# Headers sent with every feed request; aiohttp decodes gzip/deflate bodies itself
+HEADERS = {
+    'User-Agent': 'AITrackerBot/1.0 (Agentic Insight Tracker; +https://github.com/your-org/ai-tracker)',
+    'Accept': 'application/rss+xml, application/xml, text/xml, */*',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+
+@lru_cache(maxsize=1)
+def _load_sources_config():
+    """Load sources.json once per process."""
+    sources_config_path = Path(__file__).parent / "app" / "core" / "sources.json"
+    return orjson.loads(sources_config_path.read_bytes())
+
+
+def load_feed_cache():
+    """Load cached feeds keyed by URL, or an empty cache if none is usable."""
+    try:
+        return orjson.loads(FEED_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_feed_cache(cache):
+    """Persist cached feeds for the next run."""
+    FEED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    FEED_CACHE_PATH.write_bytes(orjson.dumps(cache))
+
+
+def cache_feed(feed, etag, last_modified, entry_count):
+    """Build a cache record holding the validators and the fields the test reads."""
+    return {
+        'etag': etag,
+        'last_modified': last_modified,
+        'entry_count': entry_count,
+        'title': feed.feed.get('title', 'Unknown'),
+        'entries': [
+            {field: entry[field] for field in CACHED_ENTRY_FIELDS if field in entry}
+            for entry in feed.entries
+        ],
+    }
+
+
+def cached_feed(record):
+    """Rebuild a feedparser-style result from a cache record."""
+    return feedparser.FeedParserDict(
+        feed=feedparser.FeedParserDict(title=record['title']),
+        entries=[feedparser.FeedParserDict(entry) for entry in record['entries']],
+        bozo=False,
+    )
+
+
+def _truncate_rss(raw: bytes, n: int) -> bytes:
+    """
+    Cut an RSS 2.0 body after its nth </item> and close the document.
+    
+    Anything else (Atom, RSS 1.0, or feeds with n items or fewer) is returned unchanged.
+    """
+    rss_start = raw.find(b'<rss')
+    first_item = raw.find(b'<item')
+    if rss_start < 0 or first_item < rss_start:
+        return raw
+    
+    end = first_item
+    for _ in range(n):
+        end = raw.find(b'</item>', end)
+        if end < 0:
+            return raw
+        end += len(b'</item>')
+    
+    if raw.find(b'<item', end) < 0:
+        return raw  # No more items, nothing to save
+    return raw[:end] + b'</channel></rss>'
+
+
+def _entry_text(entry):
+    """Join an entry's title, summary and first content block for keyword matching."""
+    content = ""
+    if entry.get('content'):
+        if isinstance(entry.content, list) and entry.content:
+            content = entry.content[0].get('value', '')
+        else:
+            content = str(entry.content)
+    return " ".join((entry.get('title', ''), entry.get('summary', ''), content))
+
+
+async def fetch_feed(session, semaphore, url, cached=None):
+    """
+    Fetch a feed URL, revalidating against the cached record if there is one.
+    
+    Returns (status, content type, raw body bytes or None, ETag, Last-Modified).
+    """
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    async with semaphore:
+        async with session.get(url, headers=headers) as response:
+            content = await response.read() if response.status == 200 else None
+            return (
+                response.status,
+                response.headers.get('content-type', 'Unknown'),
+                content,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+            )
+
+
+async def test_sourcegraph_feed(session):
     """Test the Sourcegraph feed specifically."""
     
     print("=== Testing Sourcegraph Feed ===")
     
+    # Load sources config to add relevance keywords
+    sources_config = _load_sources_config()
+    
+    # Find sourcegraph source config
+    sourcegraph_config = None
+    for source_config in sources_config.get("sources", []):
+        if source_config["name"] == "sourcegraph":
+            sourcegraph_config = source_config
+            break
+    
     # Test 1: Direct HTTP request with User-Agent
     print("\n1. Testing direct HTTP request...")
     
-    headers = {
-        'User-Agent': 'AITrackerBot/1.0 (Agentic Insight Tracker; +https://github.com/your-org/ai-tracker)',
-        'Accept': 'application/rss+xml, application/xml, text/xml, */*',
-        'Accept-Encoding': 'gzip, deflate'
-    }
+    # Fetch the legacy feed URL and the configured endpoint concurrently
+    urls = ["https://about.sourcegraph.com/blog/rss.xml"]
+    if sourcegraph_config and sourcegraph_config.get("endpoint") not in urls:
+        urls.append(sourcegraph_config["endpoint"])
     
-    url = "https://about.sourcegraph.com/blog/rss.xml"
+    feed_cache = load_feed_cache()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    results = await asyncio.gather(
+        *(fetch_feed(session, semaphore, url, feed_cache.get(url)) for url in urls),
+        return_exceptions=True
+    )
     
-    async with aiohttp.ClientSession() as session:
+    feed = None
+    entry_count = 0
+    cache_updated = False
+    for url, result in zip(urls, results):
+        print(f"URL: {url}")
+        if isinstance(result, Exception):
+            print(f"Request failed: {result}")
+            continue
+        
+        status, content_type, body, etag, last_modified = result
+        print(f"Status: {status}")
+        print(f"Content-Type: {content_type}")
+        if status == 304 and url in feed_cache:
+            # Not modified: reuse the cached entries instead of parsing again
+            print(f"Not modified, reusing {len(feed_cache[url]['entries'])} cached entries")
+            if feed is None:
+                feed = cached_feed(feed_cache[url])
+                entry_count = feed_cache[url].get('entry_count', len(feed.entries))
+        elif status != 200:
+            print(f"HTTP Error: {status}")
+        else:
+            print(f"Content length: {len(body)} bytes")
+            parsed = feedparser.parse(_truncate_rss(body, SAMPLE_ENTRIES))
+            # Count every item from the raw bytes, since only a prefix was parsed
+            parsed_count = body.count(b'</item>') or len(parsed.entries)
+            if etag or last_modified:
+                feed_cache[url] = cache_feed(parsed, etag, last_modified, parsed_count)
+                cache_updated = True
+            if feed is None:
+                feed = parsed
+                entry_count = parsed_count
+    
+    if cache_updated:
+        save_feed_cache(feed_cache)
+    
+    if feed is not None:
         try:
-            async with session.get(url, headers=headers) as response:
-                print(f"Status: {response.status}")
-                print(f"Content-Type: {response.headers.get('content-type', 'Unknown')}")
+            # Test 2: Parse with feedparser
+            print("\n2. Testing feedparser...")
+            
+            print(f"Feed title: {feed.feed.get('title', 'Unknown')}")
+            print(f"Feed bozo: {feed.bozo}")
+            if hasattr(feed, 'bozo_exception') and feed.bozo_exception:
+                print(f"Bozo exception: {feed.bozo_exception}")
+            
+            print(f"Number of entries: {entry_count}")
+            
+            if feed.entries:
+                # Show first entry
+                entry = feed.entries[0]
+                print(f"\nFirst entry:")
+                print(f"  Title: {entry.get('title', 'No title')}")
+                print(f"  Published: {entry.get('published', 'No date')}")
+                print(f"  Link: {entry.get('link', 'No link')}")
+                print(f"  Summary: {entry.get('summary', 'No summary')[:200]}...")
+            
+            # Test 3: Keyword matching
+            print("\n3. Testing keyword matching...")
+            
+            # Initialize keyword filter
+            keyword_filter = KeywordFilter.from_config_file()
+            
+            if sourcegraph_config:
+                relevance_keywords = sourcegraph_config.get("relevance_keywords", [])
+                keyword_filter.add_source_keywords("sourcegraph", relevance_keywords)
+                print(f"Added {len(relevance_keywords)} relevance keywords for sourcegraph")
                 
-                if response.status == 200:
-                    content = await response.text()
-                    print(f"Content length: {len(content)} characters")
-                    
-                    # Test 2: Parse with feedparser
-                    print("\n2. Testing feedparser...")
-                    feed = feedparser.parse(content)
-                    
-                    print(f"Feed title: {feed.feed.get('title', 'Unknown')}")
-                    print(f"Feed bozo: {feed.bozo}")
-                    if hasattr(feed, 'bozo_exception') and feed.bozo_exception:
-                        print(f"Bozo exception: {feed.bozo_exception}")
-                    
-                    print(f"Number of entries: {len(feed.entries)}")
-                    
-                    if feed.entries:
-                        # Show first entry
-                        entry = feed.entries[0]
-                        print(f"\nFirst entry:")
-                        print(f"  Title: {entry.get('title', 'No title')}")
-                        print(f"  Published: {entry.get('published', 'No date')}")
-                        print(f"  Link: {entry.get('link', 'No link')}")
-                        print(f"  Summary: {entry.get('summary', 'No summary')[:200]}...")
-                    
-                    # Test 3: Keyword matching
-                    print("\n3. Testing keyword matching...")
-                    
-                    # Initialize keyword filter
-                    keyword_filter = KeywordFilter.from_config_file()
-                    
-                    # Load sources config to add relevance keywords
-                    sources_config_path = Path(__file__).parent / "app" / "core" / "sources.json"
-                    with open(sources_config_path, 'r') as f:
-                        sources_config = json.load(f)
-                    
-                    # Find sourcegraph source config
-                    sourcegraph_config = None
-                    for source_config in sources_config.get("sources", []):
-                        if source_config["name"] == "sourcegraph":
-                            sourcegraph_config = source_config
-                            break
-                    
-                    if sourcegraph_config:
-                        relevance_keywords = sourcegraph_config.get("relevance_keywords", [])
-                        keyword_filter.add_source_keywords("sourcegraph", relevance_keywords)
-                        print(f"Added {len(relevance_keywords)} relevance keywords for sourcegraph")
-                        
-                        # Show effective keywords
-                        effective_keywords = keyword_filter.get_keywords_for_source("sourcegraph")
-                        print(f"Total effective keywords: {len(effective_keywords)}")
-                        print(f"Keywords: {sorted(list(effective_keywords))[:10]}...")  # Show first 10
+                # Show effective keywords
+                effective_keywords = keyword_filter.get_keywords_for_source("sourcegraph")
+                print(f"Total effective keywords: {len(effective_keywords)}")
+                print(f"Keywords: {heapq.nsmallest(10, effective_keywords)}...")  # Show first 10
+                
+                # Test keyword matching on first few entries
+                if feed.entries:
+                    print(f"\nTesting keyword matching on first 3 entries...")
+                    match_results = []
+                    entry_texts_lower = []
+                    for i, entry in enumerate(feed.entries[:3]):
+                        title = entry.get('title', '')
+                        text_for_filtering = _entry_text(entry)
+                        text_for_filtering_lower = text_for_filtering.lower()
+                        entry_texts_lower.append(text_for_filtering_lower)
+                        matched_keywords = keyword_filter.match(
+                            "sourcegraph", text_for_filtering, text_for_filtering_lower
+                        )
+                        match_results.append(matched_keywords)
+                        print(f"Entry {i+1}: '{title[:60]}...'")
+                        print(f"  Matched keywords: {matched_keywords}")
                         
-                        # Test keyword matching on first few entries
-                        if feed.entries:
-                            print(f"\nTesting keyword matching on first 3 entries...")
-                            for i, entry in enumerate(feed.entries[:3]):
-                                title = entry.get('title', '')
-                                summary = entry.get('summary', '')
-                                content = ""
-                                if entry.get('content'):
-                                    if isinstance(entry.content, list) and entry.content:
-                                        content = entry.content[0].get('value', '')
-                                    else:
-                                        content = str(entry.content)
-                                
-                                text_for_filtering = f"{title} {summary} {content}"
-                                matched_keywords = keyword_filter.match("sourcegraph", text_for_filtering)
-                                print(f"Entry {i+1}: '{title[:60]}...'")
-                                print(f"  Matched keywords: {matched_keywords}")
-                                
-                                if matched_keywords:
-                                    # Test tool detection
-                                    tool_detector = ToolDetector()
-                                    mentioned_tools = tool_detector.detect_tools(matched_keywords)
-                                    mentioned_concepts = tool_detector.detect_concepts(matched_keywords)
-                                    print(f"  Detected tools: {mentioned_tools}")
-                                    print(f"  Detected concepts: {mentioned_concepts}")
-                                    break  # Found a match, no need to continue
-                            
-                            # If no matches found, let's see what keywords we're looking for
-                            if not any(keyword_filter.match("sourcegraph", f"{e.get('title', '')} {e.get('summary', '')}") for e in feed.entries[:3]):
-                                print(f"\nNo matches found in first 3 entries.")
-                                print(f"Sample keywords we're looking for: {list(effective_keywords)[:20]}")
-                                
-                                # Check if 'sourcegraph' keyword itself appears
-                                for i, entry in enumerate(feed.entries[:3]):
-                                    text = f"{entry.get('title', '')} {entry.get('summary', '')}".lower()
-                                    if 'sourcegraph' in text:
-                                        print(f"Entry {i+1} contains 'sourcegraph' in text")
-                                    if 'cody' in text:
-                                        print(f"Entry {i+1} contains 'cody' in text")
-                                    if 'code search' in text:
-                                        print(f"Entry {i+1} contains 'code search' in text")
-                    
-                else:
-                    print(f"HTTP Error: {response.status}")
+                        if matched_keywords:
+                            # Test tool detection
+                            mentioned_tools, mentioned_concepts = tool_detector.detect(matched_keywords)
+                            print(f"  Detected tools: {mentioned_tools}")
+                            print(f"  Detected concepts: {mentioned_concepts}")
+                            break  # Found a match, no need to continue
                     
+                    # If no matches found, let's see what keywords we're looking for
+                    if not any(match_results):
+                        print(f"\nNo matches found in first 3 entries.")
+                        print(f"Sample keywords we're looking for: {list(effective_keywords)[:20]}")
+                        
+                        # Check if 'sourcegraph' keyword itself appears
+                        for i, text in enumerate(entry_texts_lower):
+                            if 'sourcegraph' in text:
+                                print(f"Entry {i+1} contains 'sourcegraph' in text")
+                            if 'cody' in text:
+                                print(f"Entry {i+1} contains 'cody' in text")
+                            if 'code search' in text:
+                                print(f"Entry {i+1} contains 'code search' in text")
+        
         except Exception as e:
-            print(f"Request failed: {e}")
+            print(f"Feed test failed: {e}")
     
     # Test 4: Full source manager test
     print("\n5. Testing with SourceManager...")
@@ -168,5 +315,18 @@ async def test_sourcegraph_feed():
         print(f"SourceManager test failed: {e}")
 
 
+async def main():
+    # Collect the report in memory and write it out once, even if the test raises
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            # One keep-alive session for every request the test makes
+            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+                await test_sourcegraph_feed(session)
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
 if __name__ == "__main__":
-    asyncio.run(test_sourcegraph_feed())
+    asyncio.run(main())
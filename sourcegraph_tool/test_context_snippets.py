@@ -2,12 +2,16 @@
 
 import sys
 import os
-sys.path.append('backend')
 
-from app.core.text_processor import TextProcessor
+# Put the backend on the path once, wherever the script is run from
+backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from app.core.text_processor import text_processor
 
 def test_context_snippets():
-    processor = TextProcessor()
+    processor = text_processor
     
     # Test cases with explicit "Amp" mentions in coding context
     test_cases = [
@@ -34,23 +38,27 @@ def test_context_snippets():
         combined_text = f"{test_case['title']} {test_case['content']}"
         print(f"Full text: {combined_text}")
         
+        # Tokenize and find the query once; every snippet call below reuses them
+        prepared = processor.prepare(combined_text)
+        matches = processor.find_matches(prepared, test_case['query'])
+        
         # Test new context snippet extraction
         context_snippet = processor.extract_keyword_context_snippet(
-            combined_text, test_case['query'], words_around=25
+            prepared, test_case['query'], words_around=25, matches=matches
         )
         print(f"\nContext snippet (25 words): {context_snippet}")
         print(f"Contains <mark>: {'<mark>' in context_snippet}")
         
         # Test with more words
         context_snippet_50 = processor.extract_keyword_context_snippet(
-            combined_text, test_case['query'], words_around=50
+            prepared, test_case['query'], words_around=50, matches=matches
         )
         print(f"\nContext snippet (50 words): {context_snippet_50}")
         print(f"Contains <mark>: {'<mark>' in context_snippet_50}")
         
         # Test the main extract_relevant_snippet function
         relevant_snippet = processor.extract_relevant_snippet(
-            combined_text, test_case['query'], max_length=300, highlight=True
+            prepared, test_case['query'], max_length=300, highlight=True, matches=matches
         )
         print(f"\nRelevant snippet: {relevant_snippet}")
         print(f"Contains <mark>: {'<mark>' in relevant_snippet}")
@@ -2,12 +2,16 @@
 
 import sys
 import os
-sys.path.append('backend')
 
-from app.core.text_processor import TextProcessor
+# Put the backend on the path once, wherever the script is run from
+backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from app.core.text_processor import text_processor
 
 def test_smart_search():
-    processor = TextProcessor()
+    processor = text_processor
     
     # Test cases from the actual search results
     test_cases = [
@@ -32,27 +36,30 @@ def test_smart_search():
         print(f"\n=== Test Case {i+1}: {test_case['title'][:50]}... ===")
         
         combined_text = f"{test_case['title']} {test_case['content']}"
+        # Tokenize, clean and find the query once; every helper below reuses them
+        prepared = processor.prepare(combined_text)
+        matches = processor.find_matches(prepared, test_case['query'])
         
         # Test cleaning
-        clean_text = processor.clean_text_for_search(combined_text)
+        clean_text = processor.clean_text_for_search(prepared)
         print(f"Original text: {combined_text[:100]}...")
         print(f"Clean text: {clean_text[:100]}...")
         print(f"Contains 'amp': {'amp' in clean_text.lower()}")
         
         # Test scoring
-        score = processor.score_text_relevance(combined_text, test_case['query'])
+        score = processor.score_text_relevance(prepared, test_case['query'])
         print(f"Relevance score: {score}")
         
         # Test snippet extraction
         snippet = processor.extract_relevant_snippet(
-            combined_text, test_case['query'], max_length=300, highlight=True
+            prepared, test_case['query'], max_length=300, highlight=True, matches=matches
         )
         print(f"Smart snippet: {snippet}")
         print(f"Contains <mark>: {'<mark>' in snippet}")
         
         # Test the new keyword context extraction directly
         context_snippet = processor.extract_keyword_context_snippet(
-            combined_text, test_case['query'], words_around=50
+            prepared, test_case['query'], words_around=50, matches=matches
         )
         print(f"Context snippet: {context_snippet}")
         print(f"Context contains <mark>: {'<mark>' in context_snippet}")